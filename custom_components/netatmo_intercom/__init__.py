@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     CONF_CLIENT_ID, 
     CONF_CLIENT_SECRET, 
+    CONF_TOKEN,
+    DATA_APIS,
     DOMAIN, 
 )
 from .netatmo_api import NetatmoAPI
@@ -20,44 +26,79 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SWITCH]  # For door controls
 
+TOKEN_REFRESH_INTERVAL = timedelta(minutes=5)
+
+
+def _account(entry: ConfigEntry) -> tuple[str, str]:
+    """Return the key identifying the Netatmo account of an entry."""
+    return entry.data[CONF_CLIENT_ID], entry.data[CONF_USERNAME]
+
+
+def _async_get_api(hass: HomeAssistant, entry: ConfigEntry) -> NetatmoAPI:
+    """Return the API client for the entry's account, creating it if needed.
+
+    Entries for the same account share one client, and with it the token.
+    """
+    apis: dict[tuple[str, str], NetatmoAPI] = hass.data[DOMAIN].setdefault(DATA_APIS, {})
+    account = _account(entry)
+    if account in apis:
+        return apis[account]
+
+    @callback
+    def _async_save_token(token: dict[str, Any]) -> None:
+        """Persist refreshed tokens so reloads and restarts skip the password grant."""
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            if _account(config_entry) == account:
+                hass.config_entries.async_update_entry(
+                    config_entry, data={**config_entry.data, CONF_TOKEN: token}
+                )
+
+    api = apis[account] = NetatmoAPI(
+        async_get_clientsession(hass),
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        entry.data[CONF_CLIENT_ID],
+        entry.data[CONF_CLIENT_SECRET],
+        entry.data.get(CONF_TOKEN),
+        _async_save_token,
+    )
+    return api
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Netatmo Video Intercom from a config entry."""
 
-    if hass.data.get(DOMAIN) is None:
-        hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, {})
 
-    # Create API instance and authenticate
+    # Get the (shared) API instance and authenticate
     try:
-        api = NetatmoAPI(
-            entry.data[CONF_USERNAME],
-            entry.data[CONF_PASSWORD],
-            entry.data[CONF_CLIENT_ID],
-            entry.data[CONF_CLIENT_SECRET],
-        )
-        
-        # Authenticate
-        await hass.async_add_executor_job(api.authenticate)
+        api = _async_get_api(hass, entry)
         
-        # Get door modules
-        door_modules = await hass.async_add_executor_job(api.get_door_modules)
+        # Get door modules (authenticates first only if the cached token is unusable)
+        door_modules = await api.get_door_modules()
         
         if not door_modules:
             _LOGGER.warning("No door modules found in Netatmo account")
             
     except Exception as e:
-        _LOGGER.error("Failed to setup Netatmo integration: %s", e)
+        _LOGGER.error("Failed to setup Netatmo integration: %r", e)
         raise ConfigEntryNotReady from e
 
     # Store API instance and door modules data
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "door_modules": door_modules,
+        "options": dict(entry.options),
     }
 
+    # Keep the token fresh in the background instead of on a door press
+    entry.async_on_unload(
+        async_track_time_interval(hass, api.async_maybe_refresh, TOKEN_REFRESH_INTERVAL)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    entry.add_update_listener(async_reload_entry)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
@@ -73,7 +114,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the shared API client once no other entry uses the account."""
+    account = _account(entry)
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        if config_entry.entry_id != entry.entry_id and _account(config_entry) == account:
+            return
+    hass.data.get(DOMAIN, {}).get(DATA_APIS, {}).pop(account, None)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload entries."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # Token updates also notify the listener; only options changes need a reload
+    data = hass.data[DOMAIN].get(entry.entry_id)
+    if data is None or entry.options == data["options"]:
+        return
+
+    # Reload through Home Assistant so the entry's unload callbacks run
+    await hass.config_entries.async_reload(entry.entry_id)
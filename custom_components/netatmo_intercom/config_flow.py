@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
+import aiohttp
+import orjson
 import voluptuous as vol
-import requests
 
 from homeassistant import config_entries, exceptions
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_SYNC_INTERVAL, CONF_CLIENT_ID, CONF_CLIENT_SECRET, DEFAULT_SYNC_INTERVAL, DOMAIN, NETATMO_AUTH_URL
+from .const import CONF_SYNC_INTERVAL, CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_TOKEN, DEFAULT_SYNC_INTERVAL, DOMAIN, NETATMO_AUTH_URL
+from .netatmo_api import REQUEST_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,8 +38,10 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
 
+    session = async_get_clientsession(hass)
+
     # Test authentication with Netatmo
-    def _test_login():
+    async def _test_login():
         auth_data = {
             "grant_type": "password",
             "username": data[CONF_USERNAME],
@@ -45,20 +52,31 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         
         try:
-            resp = requests.post(NETATMO_AUTH_URL, data=auth_data, headers=headers, timeout=10)
-            resp.raise_for_status()
-            token_data = resp.json()
-            return "access_token" in token_data
-        except requests.exceptions.RequestException:
-            return False
-
-    authenticated = await hass.async_add_executor_job(_test_login)
-
-    if not authenticated:
+            async with session.post(
+                NETATMO_AUTH_URL,
+                data=auth_data,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                resp.raise_for_status()
+                token_data = orjson.loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+            return None
+
+        if "access_token" not in token_data:
+            return None
+
+        # Store an absolute expiry so the token can be reused after a restart
+        token_data["expires_at"] = time.time() + token_data.get("expires_in", 10800)
+        return token_data
+
+    token_data = await _test_login()
+
+    if not token_data:
         raise InvalidAuth
 
     # Return info that you want to store in the config entry.
-    return {"title": "Netatmo Video Intercom"}
+    return {"title": "Netatmo Video Intercom", "token": token_data}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -84,7 +102,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title=info["title"], data=user_input)
+                return self.async_create_entry(
+                    title=info["title"], data={**user_input, CONF_TOKEN: info["token"]}
+                )
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
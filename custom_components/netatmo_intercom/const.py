@@ -9,9 +9,13 @@ DEVICE_NAME = "Video Intercom"
 CONF_SYNC_INTERVAL = "sync_interval"
 CONF_CLIENT_ID = "client_id"
 CONF_CLIENT_SECRET = "client_secret"
+CONF_TOKEN = "token"
 
 DEFAULT_SYNC_INTERVAL = 30  # seconds
 
+# hass.data[DOMAIN] key holding the API clients shared per Netatmo account
+DATA_APIS = "apis"
+
 # Netatmo API endpoints
 NETATMO_AUTH_URL = "https://app.netatmo.net/oauth2/token"
 NETATMO_API_URL = "https://app.netatmo.net/api"
@@ -2,22 +2,66 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 import time
 
-import requests
+import aiohttp
+import orjson
 
 from .const import NETATMO_AUTH_URL, NETATMO_API_URL, NETATMO_SETSTATE_URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Total timeout shared by every Netatmo request, including the config flow login
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Up to three attempts, waiting 0.5s and then 1s between them
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_MIN = 0.5
+# Errors where retrying is safe for idempotent calls (homesdata, token endpoint)
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+# Upper bound for one API operation, including token renewal and all retries
+REQUEST_DEADLINE = 20
+
+# Stop calling Netatmo for a while after this many consecutive failures
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_OPEN_SECONDS = 30
+
+# How long door modules are reused, e.g. when the entry reloads after an options change
+DOOR_MODULES_CACHE_SECONDS = 300
+
+
+class NetatmoCircuitOpen(Exception):
+    """Error to indicate requests are rejected after repeated failures."""
+
+
+class NetatmoInvalidResponse(aiohttp.ClientError):
+    """Error to indicate Netatmo answered with a body that is not valid JSON."""
+
 
 class NetatmoAPI:
     """Netatmo API client."""
 
-    def __init__(self, username: str, password: str, client_id: str, client_secret: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        client_id: str,
+        client_secret: str,
+        token: Dict[str, Any] | None = None,
+        on_token_update: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        A token obtained earlier (e.g. by the config flow) can be passed to
+        skip the initial password grant while it is still valid.
+        ``on_token_update`` is called with every new token so it can be stored.
+        """
+        self._session = session
+        self._on_token_update = on_token_update
         self.username = username
         self.password = password
         self.client_id = client_id
@@ -25,8 +69,80 @@ class NetatmoAPI:
         self.access_token = None
         self.refresh_token = None
         self.token_expires_at = None
+        self._failures = 0
+        self._circuit_open_until = 0.0
+        # Entries and presses sharing this client must not renew the token
+        # concurrently: Netatmo rotates refresh tokens on every use
+        self._refresh_lock = asyncio.Lock()
+        self._door_modules_cache: tuple[float, List[Dict[str, Any]]] | None = None
+        self._auth_headers: Dict[str, str] = {}
+        self._json_headers: Dict[str, str] = {}
 
-    def authenticate(self) -> str:
+        if token:
+            self.access_token = token["access_token"]
+            self.refresh_token = token.get("refresh_token")
+            self.token_expires_at = token["expires_at"] - 300  # Refresh 5 min before expiry
+            self._update_headers()
+
+    def _update_headers(self) -> None:
+        """Build the request headers for the current access token."""
+        self._auth_headers = {"Authorization": f"Bearer {self.access_token}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+
+    def _save_token(self) -> None:
+        """Hand the current token to the owner so it can be persisted."""
+        if self._on_token_update is None:
+            return
+        self._on_token_update(
+            {
+                "access_token": self.access_token,
+                "refresh_token": self.refresh_token,
+                "expires_at": self.token_expires_at + 300,
+            }
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        deadline: float | None = None,
+        retry_on: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Send a request and return the decoded JSON body.
+
+        Errors listed in ``retry_on`` are retried with backoff as long as the
+        ``deadline`` (a time.monotonic() value) allows; HTTP errors (e.g.
+        rejected credentials) are raised right away.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + REQUEST_DEADLINE
+        
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"Deadline exceeded before request to {url}")
+            timeout = REQUEST_TIMEOUT
+            if remaining < REQUEST_TIMEOUT.total:
+                timeout = aiohttp.ClientTimeout(total=remaining)
+            
+            try:
+                async with self._session.request(method, url, timeout=timeout, **kwargs) as resp:
+                    resp.raise_for_status()
+                    try:
+                        return orjson.loads(await resp.read())
+                    except orjson.JSONDecodeError as e:
+                        # e.g. a maintenance page served with a 200 status
+                        raise NetatmoInvalidResponse(f"Invalid JSON response from {url}") from e
+            except retry_on as e:
+                delay = RETRY_BACKOFF_MIN * 2 ** (attempt - 1)
+                if attempt == RETRY_ATTEMPTS or time.monotonic() + delay >= deadline:
+                    raise
+                _LOGGER.debug("Request to %s failed (%r), retrying in %s seconds", url, e, delay)
+                await asyncio.sleep(delay)
+
+    async def authenticate(self, deadline: float | None = None) -> str:
         """Authenticate and get access token."""
         data = {
             "grant_type": "password",
@@ -37,24 +153,41 @@ class NetatmoAPI:
         }
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         
-        resp = requests.post(NETATMO_AUTH_URL, data=data, headers=headers, timeout=10)
-        resp.raise_for_status()
-        
-        token_data = resp.json()
+        token_data = await self._request(
+            "POST", NETATMO_AUTH_URL, deadline=deadline, data=data, headers=headers
+        )
+        if "access_token" not in token_data:
+            raise NetatmoInvalidResponse("Token response without access_token")
         self.access_token = token_data["access_token"]
         self.refresh_token = token_data.get("refresh_token")
         
         expires_in = token_data.get("expires_in", 10800)  # 3 hours default
         self.token_expires_at = time.time() + expires_in - 300  # Refresh 5 min before expiry
+        self._update_headers()
+        self._save_token()
         
-        _LOGGER.info("Authenticated successfully, token expires in %s seconds", expires_in)
+        _LOGGER.debug("Authenticated successfully, token expires in %s seconds", expires_in)
         return self.access_token
 
-    def _refresh_access_token(self) -> str:
-        """Refresh the access token using refresh token."""
+    async def _refresh_access_token(self, deadline: float | None = None) -> str:
+        """Refresh the access token, unless another caller just did."""
+        stale_token = self.access_token
+        async with self._refresh_lock:
+            if self.access_token != stale_token:
+                # Renewed while we were waiting for the lock
+                return self.access_token
+            return await self._async_refresh_token(deadline)
+
+    async def _async_refresh_token(self, deadline: float | None = None) -> str:
+        """Refresh the access token using refresh token, with the lock held."""
+        # The password grant fallback shares the deadline, so it can't add a
+        # second full round of retries
+        if deadline is None:
+            deadline = time.monotonic() + REQUEST_DEADLINE
+        
         if not self.refresh_token:
             _LOGGER.warning("No refresh token available, re-authenticating")
-            return self.authenticate()
+            return await self.authenticate(deadline)
 
         data = {
             "grant_type": "refresh_token",
@@ -65,100 +198,173 @@ class NetatmoAPI:
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         
         try:
-            resp = requests.post(NETATMO_AUTH_URL, data=data, headers=headers, timeout=10)
-            resp.raise_for_status()
-            
-            token_data = resp.json()
+            token_data = await self._request(
+                "POST", NETATMO_AUTH_URL, deadline=deadline, data=data, headers=headers
+            )
+            if "access_token" not in token_data:
+                raise NetatmoInvalidResponse("Token response without access_token")
             self.access_token = token_data["access_token"]
             self.refresh_token = token_data.get("refresh_token", self.refresh_token)
             
             expires_in = token_data.get("expires_in", 10800)
             self.token_expires_at = time.time() + expires_in - 300
+            self._update_headers()
+            self._save_token()
             
-            _LOGGER.info("Token refreshed successfully")
+            _LOGGER.debug("Token refreshed successfully")
             return self.access_token
             
-        except requests.exceptions.RequestException as e:
-            _LOGGER.error("Failed to refresh token: %s, re-authenticating", e)
-            return self.authenticate()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.error("Failed to refresh token: %r, re-authenticating", e)
+            return await self.authenticate(deadline)
 
-    def _ensure_valid_token(self) -> None:
+    async def _ensure_valid_token(self, deadline: float | None = None) -> None:
         """Ensure we have a valid access token."""
-        if not self.access_token:
-            self.authenticate()
+        if self.access_token and not self._token_expired():
             return
-            
-        # Check if token is expired or close to expiry
-        if self.token_expires_at and time.time() >= self.token_expires_at:
-            _LOGGER.info("Token expired, refreshing...")
-            self._refresh_access_token()
-
-    def _make_authenticated_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make an authenticated request with automatic token refresh on 403."""
-        self._ensure_valid_token()
         
-        headers = kwargs.get("headers", {})
-        headers["Authorization"] = f"Bearer {self.access_token}"
-        kwargs["headers"] = headers
+        async with self._refresh_lock:
+            # Check again, another caller may have renewed it while we waited
+            if not self.access_token:
+                await self.authenticate(deadline)
+            elif self._token_expired():
+                _LOGGER.info("Token expired, refreshing...")
+                await self._async_refresh_token(deadline)
+
+    def _token_expired(self) -> bool:
+        """Return whether the token is expired or close to expiry."""
+        return bool(self.token_expires_at and time.time() >= self.token_expires_at)
+
+    async def async_maybe_refresh(self, _now: Any = None) -> None:
+        """Refresh the token ahead of expiry so requests don't have to wait for it."""
+        if not self.token_expires_at or self.token_expires_at - time.time() >= 600:
+            return
+        # Leave Netatmo alone while the circuit breaker is open
+        if time.time() < self._circuit_open_until:
+            return
+        try:
+            await self._refresh_access_token()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.warning("Proactive token refresh failed: %r", e)
+
+    def _headers_for(self, data: bytes | None) -> Dict[str, str]:
+        """Return the prebuilt headers for a request with or without a JSON body."""
+        return self._auth_headers if data is None else self._json_headers
+
+    async def _make_authenticated_request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        retry_on: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+    ) -> Dict[str, Any]:
+        """Make an authenticated request with automatic token refresh on 403.
+
+        ``data`` is sent as a JSON body and ``retry_on`` limits which errors
+        of the request itself are retried. The whole call, token renewal
+        included, is bounded by REQUEST_DEADLINE. After repeated connection failures or
+        server errors, requests fail fast with NetatmoCircuitOpen until the
+        cool-down period has passed.
+        """
+        if time.time() < self._circuit_open_until:
+            raise NetatmoCircuitOpen("Netatmo API unavailable, retrying later")
+        
+        deadline = time.monotonic() + REQUEST_DEADLINE
         
         try:
-            resp = requests.request(method, url, timeout=10, **kwargs)
-            
-            # If we get 403, try refreshing token once
-            if resp.status_code == 403:
+            await self._ensure_valid_token(deadline)
+            try:
+                result = await self._request(
+                    method,
+                    url,
+                    deadline=deadline,
+                    retry_on=retry_on,
+                    data=data,
+                    headers=self._headers_for(data),
+                )
+            except aiohttp.ClientResponseError as e:
+                # If we get 403, try refreshing token once
+                if e.status != 403:
+                    raise
                 _LOGGER.warning("Got 403, refreshing token and retrying...")
-                self._refresh_access_token()
-                headers["Authorization"] = f"Bearer {self.access_token}"
-                kwargs["headers"] = headers
-                resp = requests.request(method, url, timeout=10, **kwargs)
-            
-            resp.raise_for_status()
-            return resp
+                await self._refresh_access_token(deadline)
+                result = await self._request(
+                    method,
+                    url,
+                    deadline=deadline,
+                    retry_on=retry_on,
+                    data=data,
+                    headers=self._headers_for(data),
+                )
             
-        except requests.exceptions.RequestException as e:
-            _LOGGER.error("Request failed: %s", e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.error("Request failed: %r", e)
+            # Client errors (4xx) are not an outage, don't count them
+            if not isinstance(e, aiohttp.ClientResponseError) or e.status >= 500:
+                self._failures += 1
+                if self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+                    _LOGGER.warning(
+                        "Netatmo API failed %s times in a row, pausing requests for %s seconds",
+                        self._failures,
+                        CIRCUIT_OPEN_SECONDS,
+                    )
+                    self._circuit_open_until = time.time() + CIRCUIT_OPEN_SECONDS
             raise
+        
+        self._failures = 0
+        return result
 
-    def get_homes_data(self) -> Dict[str, Any]:
+    async def get_homes_data(self) -> Dict[str, Any]:
         """Get homes data from Netatmo API."""
-        resp = self._make_authenticated_request("GET", f"{NETATMO_API_URL}/homesdata")
-        return resp.json()
+        return await self._make_authenticated_request("GET", f"{NETATMO_API_URL}/homesdata")
+
+    async def get_door_modules(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get door modules from homes data.
 
-    def get_door_modules(self) -> List[Dict[str, Any]]:
-        """Get door modules from homes data."""
-        homes_data = self.get_homes_data()
+        Recently parsed modules are served from cache unless ``refresh`` is
+        set. Only a response that parsed completely is cached.
+        """
+        if (
+            not refresh
+            and self._door_modules_cache
+            and time.time() - self._door_modules_cache[0] < DOOR_MODULES_CACHE_SECONDS
+        ):
+            return self._door_modules_cache[1]
+        
+        homes_data = await self.get_homes_data()
         door_modules = []
         
         for home in homes_data["body"]["homes"]:
-            home_id = home["id"]
-            timezone = home["timezone"]
-            
-            # Find bridge module (BFII type)
+            # Find the bridge module (BFII type) and door modules (BNDL type) in one pass
             bridge_id = None
+            doors = []
             for module in home["modules"]:
-                if module["type"] == "BFII":
+                module_type = module["type"]
+                if module_type == "BFII" and bridge_id is None:
                     bridge_id = module["id"]
-                    break
+                elif module_type == "BNDL":
+                    doors.append(module)
             
             if not bridge_id:
                 continue
                 
-            # Find door modules (BNDL type) 
-            for module in home["modules"]:
-                if module["type"] == "BNDL":
-                    door_modules.append({
-                        "home_id": home_id,
-                        "home_name": home["name"], 
-                        "timezone": timezone,
-                        "bridge_id": bridge_id,
-                        "module_id": module["id"],
-                        "module_name": module["name"],
-                    })
+            base = {
+                "home_id": home["id"],
+                "home_name": home["name"],
+                "timezone": home["timezone"],
+                "bridge_id": bridge_id,
+            }
+            door_modules.extend(
+                {**base, "module_id": door["id"], "module_name": door["name"]}
+                for door in doors
+            )
         
+        self._door_modules_cache = (time.time(), door_modules)
         return door_modules
 
-    def open_door(self, home_id: str, timezone: str, bridge_id: str, module_id: str) -> bool:
-        """Open a door via Netatmo API."""
+    @staticmethod
+    def build_open_door_body(home_id: str, timezone: str, bridge_id: str, module_id: str) -> bytes:
+        """Build the serialized setstate payload that opens a door."""
         data = {
             "app_type": "app_camera",
             "app_version": "4.1.1.3",
@@ -174,15 +380,25 @@ class NetatmoAPI:
                 ],
             },
         }
-        
-        resp = self._make_authenticated_request(
+        return orjson.dumps(data)
+
+    async def open_door(self, home_id: str, timezone: str, bridge_id: str, module_id: str) -> bool:
+        """Open a door via Netatmo API."""
+        return await self.open_door_raw(
+            self.build_open_door_body(home_id, timezone, bridge_id, module_id)
+        )
+
+    async def open_door_raw(self, body: bytes) -> bool:
+        """Open a door with a payload from build_open_door_body."""
+        # setstate is not idempotent: a timeout may come after the door opened,
+        # so only retry when the connection could not be established at all
+        result = await self._make_authenticated_request(
             "POST", 
             NETATMO_SETSTATE_URL,
-            json=data,
-            headers={"Content-Type": "application/json"}
+            data=body,
+            retry_on=(aiohttp.ClientConnectorError,),
         )
         
-        result = resp.json()
-        _LOGGER.info("Door open response: %s", result)
+        _LOGGER.debug("Door open response: %s", result)
         
         return True 
\ No newline at end of file
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     DOMAIN,
     MANUFACTURER
 )
+from .netatmo_api import NetatmoCircuitOpen
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,10 +49,13 @@ async def async_setup_entry(
 class NetatmoDoorSwitch(SwitchEntity):
     """Representation of a Netatmo door control switch."""
 
+    _attr_icon = "mdi:door-open"
+    # The door state is never polled, only the last command is known
+    _attr_assumed_state = True
+
     def __init__(self, api, door_module: dict[str, Any]) -> None:
         """Initialize the switch."""
         self._api = api
-        self._door_module = door_module
         
         # Create unique identifiers
         module_id = door_module["module_id"]
@@ -65,61 +72,78 @@ class NetatmoDoorSwitch(SwitchEntity):
             "model": "Video Intercom Door",
             "via_device": (DOMAIN, door_module["bridge_id"]),
         }
-        self._attr_is_on = False
-
-    @property
-    def icon(self) -> str:
-        """Return the icon to use in the frontend."""
-        return "mdi:door-open"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "home_name": self._door_module["home_name"],
-            "module_name": self._door_module["module_name"],
-            "module_id": self._door_module["module_id"],
-            "bridge_id": self._door_module["bridge_id"],
+        self._attr_extra_state_attributes = {
+            "home_name": home_name,
+            "module_name": module_name,
+            "module_id": module_id,
+            "bridge_id": door_module["bridge_id"],
         }
+        self._attr_is_on = False
+        self._off_handle: CALLBACK_TYPE | None = None
+        
+        # The door payload never changes for this switch, serialize it once
+        self._open_body = api.build_open_door_body(
+            home_id=door_module["home_id"],
+            timezone=door_module["timezone"],
+            bridge_id=door_module["bridge_id"],
+            module_id=module_id,
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on (open door)."""
         try:
-            await self.hass.async_add_executor_job(self._open_door)
-            self._attr_is_on = True
-            self.async_write_ha_state()
+            await self._open_door()
+            
+            # A press while already on only pushes the auto-off back
+            self._cancel_auto_turn_off()
+            if not self._attr_is_on:
+                self._attr_is_on = True
+                self.async_write_ha_state()
             
             # Auto turn off after 2 seconds (momentary switch behavior)
-            self.hass.loop.call_later(2, self._auto_turn_off)
+            self._off_handle = async_call_later(self.hass, 2, self._async_auto_turn_off)
             
+        except NetatmoCircuitOpen as e:
+            raise HomeAssistantError(f"Cannot open door {self._attr_name}: {e}") from e
         except Exception as e:
-            _LOGGER.error("Failed to open door %s: %s", self._attr_name, e)
+            _LOGGER.error("Failed to open door %s: %r", self._attr_name, e)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off (no action needed for door)."""
+        self._cancel_auto_turn_off()
         self._attr_is_on = False
         self.async_write_ha_state()
 
-    def _auto_turn_off(self) -> None:
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending auto turn off."""
+        self._cancel_auto_turn_off()
+
+    def _cancel_auto_turn_off(self) -> None:
+        """Cancel the scheduled auto turn off, if any."""
+        if self._off_handle is not None:
+            self._off_handle()
+            self._off_handle = None
+
+    @callback
+    def _async_auto_turn_off(self, _now: datetime) -> None:
         """Automatically turn off the switch."""
+        self._off_handle = None
         self._attr_is_on = False
         self.async_write_ha_state()
 
-    def _open_door(self) -> None:
+    async def _open_door(self) -> None:
         """Open the door via Netatmo API."""
         try:
-            success = self._api.open_door(
-                home_id=self._door_module["home_id"],
-                timezone=self._door_module["timezone"],
-                bridge_id=self._door_module["bridge_id"],
-                module_id=self._door_module["module_id"],
-            )
+            success = await self._api.open_door_raw(self._open_body)
             
             if success:
                 _LOGGER.info("Successfully opened door: %s", self._attr_name)
             else:
                 _LOGGER.error("Failed to open door: %s", self._attr_name)
                 
+        except NetatmoCircuitOpen:
+            # async_turn_on reports the rejection to the caller, so do not log it
+            raise
         except Exception as e:
-            _LOGGER.error("Error opening door %s: %s", self._attr_name, e)
+            _LOGGER.error("Error opening door %s: %r", self._attr_name, e)
             raise 
\ No newline at end of file
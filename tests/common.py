@@ -0,0 +1,91 @@
+"""Helpers for the Netatmo Video Intercom tests."""
+import asyncio
+import time
+from unittest.mock import Mock
+
+import aiohttp
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.netatmo_intercom.const import (
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_TOKEN,
+    DOMAIN,
+)
+
+HOMES_DATA = b'{"body": {"homes": []}}'
+DOOR_HOMES_DATA = (
+    b'{"body": {"homes": [{"id": "home", "name": "Casa", "timezone": "Europe/Rome",'
+    b' "modules": [{"id": "bridge", "type": "BFII", "name": "Bridge"},'
+    b' {"id": "door", "type": "BNDL", "name": "Citofono"}]}]}}'
+)
+
+
+
+def mock_entry():
+    """Return a config entry with a valid cached token."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "pass",
+            CONF_CLIENT_ID: "id",
+            CONF_CLIENT_SECRET: "secret",
+            CONF_TOKEN: {
+                "access_token": "access",
+                "refresh_token": "refresh",
+                "expires_at": time.time() + 10800,
+            },
+        },
+    )
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, body=HOMES_DATA):
+        self.status = status
+        self.body = body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(Mock(), (), status=self.status)
+
+    async def read(self):
+        return self.body
+
+
+class FakeRequest:
+    """Async context manager returned by FakeSession.request."""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def __aenter__(self):
+        # Yield like a real request, so concurrent callers interleave
+        await asyncio.sleep(0)
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Session replaying the given results, repeating the last one."""
+
+    def __init__(self, *results, on_request=None):
+        self.results = list(results)
+        self.calls = []
+        self.posted = []
+        self.on_request = on_request
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        self.posted.append(kwargs.get("data"))
+        if self.on_request:
+            self.on_request(kwargs)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        return FakeRequest(result)
@@ -1,9 +1,58 @@
 """Test component setup."""
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.setup import async_setup_component
 
-from custom_components.loex_xsmart.const import DOMAIN
+from custom_components.netatmo_intercom.const import CONF_SYNC_INTERVAL, DOMAIN
+
+from .common import DOOR_HOMES_DATA, FakeResponse, FakeSession, mock_entry
 
 
 async def test_async_setup(hass):
     """Test the component gets setup."""
     assert await async_setup_component(hass, DOMAIN, {}) is True
+
+
+async def test_options_reload_uses_cached_homes_data(hass):
+    """Test changing options reloads the entry without fetching homesdata again."""
+    session = FakeSession(FakeResponse(body=DOOR_HOMES_DATA))
+    entry = mock_entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.netatmo_intercom.async_get_clientsession",
+        return_value=session,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert len(session.calls) == 1
+
+        hass.config_entries.async_update_entry(entry, options={CONF_SYNC_INTERVAL: 60})
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("switch.casa_citofono") is not None
+    assert len(session.calls) == 1
+
+
+async def test_setup_retry_refreshes_homes_data(hass):
+    """Test a setup after a failed one doesn't reuse the cached homesdata."""
+    session = FakeSession(
+        FakeResponse(body=b'{"body": {}}'), FakeResponse(body=DOOR_HOMES_DATA)
+    )
+    entry = mock_entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.netatmo_intercom.async_get_clientsession",
+        return_value=session,
+    ):
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.SETUP_RETRY
+
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert len(session.calls) == 2
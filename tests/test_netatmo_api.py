@@ -0,0 +1,231 @@
+"""Test the Netatmo API client."""
+import asyncio
+import time
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+
+from custom_components.netatmo_intercom import netatmo_api
+from custom_components.netatmo_intercom.netatmo_api import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_OPEN_SECONDS,
+    DOOR_MODULES_CACHE_SECONDS,
+    REQUEST_DEADLINE,
+    RETRY_ATTEMPTS,
+    NetatmoAPI,
+    NetatmoCircuitOpen,
+    NetatmoInvalidResponse,
+)
+
+from .common import FakeResponse, FakeSession
+
+
+def _api(session, expires_at=None):
+    """Return an API client with a cached token, valid unless told otherwise."""
+    token = {
+        "access_token": "access",
+        "refresh_token": "refresh",
+        "expires_at": expires_at or time.time() + 10800,
+    }
+    return NetatmoAPI(session, "user", "pass", "id", "secret", token)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Don't wait between retries."""
+    monkeypatch.setattr(netatmo_api, "RETRY_BACKOFF_MIN", 0)
+
+
+async def _trip(api):
+    """Fail enough requests in a row to open the circuit."""
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_homes_data()
+
+
+async def test_circuit_opens_after_threshold(freezer):
+    """Test requests are rejected without a call once the circuit is open."""
+    session = FakeSession(FakeResponse(status=500))
+    api = _api(session)
+
+    await _trip(api)
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD
+
+    with pytest.raises(NetatmoCircuitOpen):
+        await api.get_homes_data()
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD
+
+
+async def test_circuit_half_open_success_closes(freezer):
+    """Test a successful probe after the cool-down resets the failure count."""
+    session = FakeSession(FakeResponse(status=500))
+    api = _api(session)
+    await _trip(api)
+
+    freezer.tick(CIRCUIT_OPEN_SECONDS + 1)
+    session.results = [FakeResponse()]
+    assert await api.get_homes_data() == {"body": {"homes": []}}
+
+    # The counter starts over, so one failure short of the threshold keeps it closed
+    session.results = [FakeResponse(status=500)]
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_homes_data()
+    session.results = [FakeResponse()]
+    await api.get_homes_data()
+
+
+async def test_circuit_half_open_failure_reopens(freezer):
+    """Test a failing probe after the cool-down opens the circuit again."""
+    session = FakeSession(FakeResponse(status=500))
+    api = _api(session)
+    await _trip(api)
+
+    freezer.tick(CIRCUIT_OPEN_SECONDS + 1)
+    with pytest.raises(aiohttp.ClientResponseError):
+        await api.get_homes_data()
+    with pytest.raises(NetatmoCircuitOpen):
+        await api.get_homes_data()
+
+
+async def test_client_errors_do_not_open_circuit(freezer):
+    """Test 4xx responses are not counted as an outage."""
+    session = FakeSession(FakeResponse(status=400))
+    api = _api(session)
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD * 2):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_homes_data()
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD * 2
+
+
+async def test_invalid_json_opens_circuit(freezer):
+    """Test a 200 response that is not JSON counts as a failure."""
+    session = FakeSession(FakeResponse(body=b"<html>Maintenance</html>"))
+    api = _api(session)
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(NetatmoInvalidResponse):
+            await api.get_homes_data()
+    with pytest.raises(NetatmoCircuitOpen):
+        await api.get_homes_data()
+
+
+async def test_homes_data_retries_timeouts(no_backoff):
+    """Test idempotent requests are retried on timeouts."""
+    session = FakeSession(asyncio.TimeoutError(), FakeResponse())
+    api = _api(session)
+
+    assert await api.get_homes_data() == {"body": {"homes": []}}
+    assert len(session.calls) == 2
+
+
+async def test_homes_data_gives_up_after_attempts(no_backoff):
+    """Test retries stop after RETRY_ATTEMPTS."""
+    session = FakeSession(asyncio.TimeoutError())
+    api = _api(session)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await api.get_homes_data()
+    assert len(session.calls) == RETRY_ATTEMPTS
+
+
+async def test_open_door_not_retried_on_timeout(no_backoff):
+    """Test setstate is sent once when it times out, the door may have opened."""
+    session = FakeSession(asyncio.TimeoutError(), FakeResponse(body=b"{}"))
+    api = _api(session)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await api.open_door_raw(b"{}")
+    assert len(session.calls) == 1
+
+
+async def test_open_door_retried_on_connect_error(no_backoff):
+    """Test setstate is retried when the connection was never established."""
+    session = FakeSession(
+        aiohttp.ClientConnectorError(Mock(), OSError("refused")),
+        FakeResponse(body=b"{}"),
+    )
+    api = _api(session)
+
+    assert await api.open_door_raw(b"{}") is True
+    assert len(session.calls) == 2
+
+
+async def test_expired_token_outage_bounded_by_deadline(freezer, no_backoff):
+    """Test refresh, password grant fallback and request share one deadline."""
+
+    def _slow(kwargs):
+        # Every attempt uses up its whole timeout
+        freezer.tick(kwargs["timeout"].total)
+
+    session = FakeSession(asyncio.TimeoutError(), on_request=_slow)
+    api = _api(session, expires_at=time.time() - 1)
+    start = time.monotonic()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await api.open_door_raw(b"{}")
+    assert time.monotonic() - start <= REQUEST_DEADLINE
+
+
+async def test_maybe_refresh_skipped_while_circuit_open(freezer):
+    """Test the background refresh doesn't call Netatmo while the circuit is open."""
+    session = FakeSession(FakeResponse(status=500))
+    api = _api(session, expires_at=time.time() + 600)
+    await _trip(api)
+
+    await api.async_maybe_refresh()
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD
+
+
+async def test_maybe_refresh_handles_bad_token_response(freezer):
+    """Test a token response without access_token doesn't escape the timer."""
+    session = FakeSession(FakeResponse(body=b'{"error": "invalid_grant"}'))
+    api = _api(session, expires_at=time.time() + 600)
+
+    await api.async_maybe_refresh()
+    # Refresh, then the password grant fallback
+    assert len(session.calls) == 2
+    assert api.access_token == "access"
+
+
+async def test_door_modules_cached(freezer):
+    """Test door modules are reused within the cache period unless refreshed."""
+    session = FakeSession(FakeResponse())
+    api = _api(session)
+
+    await api.get_door_modules()
+    await api.get_door_modules()
+    assert len(session.calls) == 1
+
+    await api.get_door_modules(refresh=True)
+    assert len(session.calls) == 2
+
+    freezer.tick(DOOR_MODULES_CACHE_SECONDS + 1)
+    await api.get_door_modules()
+    assert len(session.calls) == 3
+
+
+async def test_malformed_homes_data_not_cached(freezer):
+    """Test a homesdata response that fails to parse is fetched again."""
+    session = FakeSession(FakeResponse(body=b'{"body": {}}'), FakeResponse())
+    api = _api(session)
+
+    with pytest.raises(KeyError):
+        await api.get_door_modules()
+    assert await api.get_door_modules() == []
+    assert len(session.calls) == 2
+
+
+async def test_concurrent_requests_share_one_refresh(freezer):
+    """Test requests with an expired token wait for a single refresh."""
+    session = FakeSession(
+        FakeResponse(body=b'{"access_token": "new", "refresh_token": "new"}'),
+        FakeResponse(),
+    )
+    api = _api(session, expires_at=time.time() - 1)
+
+    await asyncio.gather(api.get_homes_data(), api.get_homes_data(), api.async_maybe_refresh())
+    assert [url for _, url in session.calls].count(netatmo_api.NETATMO_AUTH_URL) == 1
+    assert api.access_token == "new"
@@ -0,0 +1,119 @@
+"""Test the door switch."""
+import logging
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.netatmo_intercom.const import DOMAIN
+from custom_components.netatmo_intercom.netatmo_api import (
+    NETATMO_SETSTATE_URL,
+    NetatmoAPI,
+    NetatmoCircuitOpen,
+)
+
+from .common import DOOR_HOMES_DATA, FakeResponse, FakeSession, mock_entry
+
+ENTITY_ID = "switch.casa_citofono"
+
+
+@pytest.fixture
+async def session(hass):
+    """Set up an entry with one door and return its session."""
+    session = FakeSession(FakeResponse(body=DOOR_HOMES_DATA), FakeResponse(body=b"{}"))
+    entry = mock_entry()
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.netatmo_intercom.async_get_clientsession",
+        return_value=session,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return session
+
+
+async def _press(hass, service=SERVICE_TURN_ON):
+    await hass.services.async_call(
+        "switch", service, {ATTR_ENTITY_ID: ENTITY_ID}, blocking=True
+    )
+
+
+def _tick(hass, freezer, seconds):
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+
+
+async def test_turn_on_posts_prebuilt_body(hass, session):
+    """Test pressing the switch posts the door's setstate payload."""
+    await _press(hass)
+
+    assert session.calls[-1] == ("POST", NETATMO_SETSTATE_URL)
+    assert session.posted[-1] == NetatmoAPI.build_open_door_body(
+        home_id="home", timezone="Europe/Rome", bridge_id="bridge", module_id="door"
+    )
+
+
+async def test_auto_off_after_last_press(hass, session, freezer):
+    """Test a second press pushes the auto turn off back."""
+    await _press(hass)
+    assert hass.states.get(ENTITY_ID).state == STATE_ON
+
+    _tick(hass, freezer, 1)
+    await _press(hass)
+
+    # 2 s after the first press, but only 1 s after the last one
+    _tick(hass, freezer, 1)
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).state == STATE_ON
+
+    _tick(hass, freezer, 1)
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+
+async def test_turn_off_cancels_auto_off(hass, session, freezer):
+    """Test turning off cancels the pending auto turn off."""
+    await _press(hass)
+    await _press(hass, SERVICE_TURN_OFF)
+    assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+    with patch(
+        "custom_components.netatmo_intercom.switch.NetatmoDoorSwitch.async_write_ha_state"
+    ) as write_state:
+        _tick(hass, freezer, 3)
+        await hass.async_block_till_done()
+    write_state.assert_not_called()
+
+
+async def test_remove_cancels_auto_off(hass, session, freezer):
+    """Test unloading the entry cancels the pending auto turn off."""
+    await _press(hass)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    with patch(
+        "custom_components.netatmo_intercom.switch.NetatmoDoorSwitch.async_write_ha_state"
+    ) as write_state:
+        _tick(hass, freezer, 3)
+        await hass.async_block_till_done()
+    write_state.assert_not_called()
+
+
+async def test_circuit_open_not_logged_as_error(hass, session, caplog):
+    """Test a press rejected by the circuit breaker is raised, not logged."""
+    with patch(
+        "custom_components.netatmo_intercom.netatmo_api.NetatmoAPI.open_door_raw",
+        side_effect=NetatmoCircuitOpen("circuit is open"),
+    ), pytest.raises(HomeAssistantError):
+        await _press(hass)
+
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]